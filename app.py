@@ -24,11 +24,13 @@ import os
 os.environ['SDL_AUDIODRIVER'] = 'dummy'
 os.environ["SDL_VIDEODRIVER"] = "kmsdrm"
 os.environ["SDL_FBDEV"] = "/dev/fb0"
+os.environ["SDL_RENDER_VSYNC"] = "0"  # frame pacing is done by the render loop
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
 import logging
 from logging.handlers import RotatingFileHandler
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import atexit
 import socket
 import time
@@ -37,6 +39,7 @@ import signal
 import sys
 
 def signal_handler(sig, frame):
+    stop_event.set()
     pygame.quit()
     sys.exit(0)
 
@@ -44,11 +47,10 @@ signal.signal(signal.SIGTERM, signal_handler)
 signal.signal(signal.SIGINT, signal_handler)
 
 from src.constants import *
-from src.data import data, data_lock, miner_stats, TickerData
+from src.data import data, data_lock, stop_event, TickerData
 from src.helpers import *
 from src.websockets import (
-    run_kraken_websocket, run_binance_websocket, run_coingecko_polling,
-    fetch_initial_binance, fetch_initial_kraken, fetch_initial_coingecko
+    run_ws_manager, fetch_initial_binance, fetch_initial_kraken, fetch_initial_coingecko
 )
 from src.miners import run_miners_polling
 from src.mempool import run_mempool_polling
@@ -91,34 +93,29 @@ wait_for_internet()
 
 logger.info(f"Config loaded: {len(MINERS_IPS)} miners configured")
 
-miner_stats["total_miners"] = len(MINERS_IPS)
-
 # INITIALIZE DATA STRUCTURES
-for symbol in MAIN_SYMBOLS + MARQUEE_SYMBOLS:
-    key = symbol.lower()
-    source = "binance"
-    if key in KRAKEN_PAIRS:
-        source = "kraken"
-    elif key in COINGECKO_IDS:
-        source = "coingecko"
+for key, source in SYMBOL_SOURCE.items():
     data[key] = TickerData(source=source)
 
 # INITIAL DATA FETCH
 binance_symbols = [
     s for s in set(MAIN_SYMBOLS + MARQUEE_SYMBOLS)
-    if data[s.lower()].source == "binance"
+    if SYMBOL_SOURCE[s.lower()] == "binance"
 ]
 
-for sym in binance_symbols:
-    fetch_initial_binance(sym)
-
-fetch_initial_kraken()
-fetch_initial_coingecko()
+# Run all bootstrap requests concurrently: startup waits for the slowest source,
+# not the sum of all round trips (each fetch logs and swallows its own errors)
+with ThreadPoolExecutor(
+    max_workers=min(8, len(binance_symbols) + 2),
+    thread_name_prefix="Bootstrap"
+) as executor:
+    for sym in binance_symbols:
+        executor.submit(fetch_initial_binance, sym)
+    executor.submit(fetch_initial_kraken)
+    executor.submit(fetch_initial_coingecko)
 
 # START BACKGROUND THREADS
-threading.Thread(target=run_kraken_websocket, daemon=True, name="KrakenWS").start()
-threading.Thread(target=run_binance_websocket, daemon=True, name="BinanceWS").start()
-threading.Thread(target=run_coingecko_polling, daemon=True, name="CoinGecko").start()
+threading.Thread(target=run_ws_manager, daemon=True, name="WSManager").start()
 threading.Thread(target=run_mempool_polling, daemon=True, name="Mempool").start()
 
 threading.Thread(
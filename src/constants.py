@@ -19,6 +19,7 @@ except Exception as e:
 
 # Configurable runtime parameters
 FPS = config_data.get("fps", 25)
+IDLE_FPS = config_data.get("idle_fps", 5)
 DIM_ALPHA = config_data.get("dim_alpha", 50)
 CANDLE_SECONDS = config_data.get("candle_seconds", 60)
 MAX_CANDLES = config_data.get("max_candles", 14)
@@ -43,6 +44,20 @@ PRICE_DECIMALS = config_data.get("price_decimals", {
 KRAKEN_PAIRS = config_data.get("kraken_pairs", {"xmrusdt": "XMR/USDT", "esxusd": "ESX/USD"})
 COINGECKO_IDS = config_data.get("coingecko_ids", {"runecoin": "runecoin"})
 
+# Lowercase data keys, normalized once (original-case lists are kept for display)
+MAIN_KEYS = [s.lower() for s in MAIN_SYMBOLS]
+MARQUEE_KEYS = [s.lower() for s in MARQUEE_SYMBOLS]
+
+# Data source per symbol key: Kraken and CoinGecko overrides, Binance otherwise
+SYMBOL_SOURCE = {
+    k: (
+        "kraken" if k in KRAKEN_PAIRS
+        else "coingecko" if k in COINGECKO_IDS
+        else "binance"
+    )
+    for k in MAIN_KEYS + MARQUEE_KEYS
+}
+
 # Miner and data behavior
 MINER_ACTIVE_THRESHOLD = config_data.get("miner_active_threshold", 0.25)
 DATA_TIMEOUT = config_data.get("data_timeout", 300)
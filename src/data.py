@@ -1,14 +1,24 @@
 """
 Thread-safe global data structures for prices, miners, mempool and connection status.
-All mutable shared data should be accessed with the appropriate lock.
+Per-symbol ticker data is accessed with data_lock. Miner and mempool stats are
+published as immutable snapshots (whole-dict replacement, atomic under the GIL):
+access them through the module (src.data.<name>) so rebinding is visible.
 """
 import time
-from collections import deque
-from typing import Dict, Any, Optional
+from collections import deque, namedtuple
+from typing import Dict, Any, List, Optional
 
 import threading
 
-from src.constants import MARQUEE_REFRESH_INTERVAL, MAX_CANDLES
+from src.constants import MARQUEE_REFRESH_INTERVAL, MAX_CANDLES, MINERS_IPS
+
+# Closed candle (immutable). The live candle is kept as a mutable
+# [start, open, high, low, close] list for in-place updates.
+Candle = namedtuple("Candle", "start open high low close")
+
+# Closed candles as columns, with the lowest low / highest high precomputed by the writer
+CandleColumns = namedtuple("CandleColumns", "opens highs lows closes low high")
+_NO_CANDLES = CandleColumns((), (), (), (), None, None)
 
 class TickerData:
     # Per-symbol market data container
@@ -18,39 +28,61 @@ class TickerData:
         self.status: str = "Connecting…"
         self.last_update: Optional[float] = None
         self.candles: deque = deque(maxlen=MAX_CANDLES)
-        self.current_candle: Optional[Dict[str, Any]] = None
+        self.current_candle: Optional[List[float]] = None
+        # Closed candles as columns, rebuilt on candle close
+        self.candle_columns: CandleColumns = _NO_CANDLES
         self.source: str = source
         self.last_marquee_price: Optional[float] = None
 
+    def rebuild_candle_columns(self):
+        # Refresh the column view of closed candles (call with data_lock held).
+        # Rebinding the tuple keeps readers lock-free: they see the old or new columns.
+        if self.candles:
+            _, opens, highs, lows, closes = zip(*self.candles)
+            self.candle_columns = CandleColumns(opens, highs, lows, closes, min(lows), max(highs))
+        else:
+            self.candle_columns = _NO_CANDLES
+
 # Main shared data
 data: Dict[str, TickerData] = {}
 data_lock = threading.Lock()
 
-miner_stats: Dict[str, Any] = {
+# Latest miner stats snapshot (replaced by the miner polling thread, never mutated).
+# "rev" increases with every publish so readers can skip unchanged snapshots.
+miner_stats_snapshot: Dict[str, Any] = {
+    "rev": 0,
     "total_hashrate_th": 0.0,
     "best_difficulty": 0.0,
     "connected_count": 0,
     "active_count": 0,
+    "total_miners": len(MINERS_IPS),
+    "hash_history": (),
+    "hash_min": 0.0,
+    "hash_max": 0.0,
 }
-miners_lock = threading.Lock()
 
+# Written by the miner thread only; readers use the tuple copy in miner_stats_snapshot
 hash_history = deque(maxlen=MAX_CANDLES)
 
-mempool_data = {
+# Latest mempool.space snapshot (replaced by the mempool polling thread, never mutated)
+mempool_snapshot: Dict[str, Any] = {
+    "rev": 0,
     "fees_sats_vb": None,
     "block_height": None,
     "mining_pool": None,
     "network_hashrate_eh": None,
     "network_difficulty": None
 }
-fees_lock = threading.Lock()
 
 # Marquee optimization helpers
 last_known_marquee_prices: Dict[str, Optional[float]] = {}
 
-# Connection status indicators
-binance_ws_status = "Connecting…"
-kraken_ws_status = "Connecting…"
+# Connection status indicators (stored lowercase, rebound by the WS threads)
+binance_ws_status = "connecting…"
+kraken_ws_status = "connecting…"
 
 wifi_ok = False
 last_wifi_check = 0.0
+
+# Set on shutdown to wake and stop background polling threads
+stop_event = threading.Event()
@@ -5,7 +5,11 @@ All shared data access is protected by locks where needed.
 import time
 import socket
 import pygame
-from typing import Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 from src.constants import (
     GREEN, RED, ORANGE, BLUE, GRAY, WHITE,
@@ -13,17 +17,38 @@ from src.constants import (
     PRICE_DECIMALS, KRAKEN_PAIRS, COINGECKO_IDS,
     MINER_ACTIVE_THRESHOLD, DATA_TIMEOUT,
     MARQUEE_SPEED, WIFI_CHECK_INTERVAL,
-    MARQUEE_SYMBOLS
+    MARQUEE_KEYS
 )
+import src.data as shared
 from src.data import (
-    data, data_lock, last_known_marquee_prices,
-    wifi_ok, last_wifi_check,
-    binance_ws_status, kraken_ws_status
+    Candle, data, data_lock, last_known_marquee_prices,
+    wifi_ok, last_wifi_check
 )
 
 import logging
 logger = logging.getLogger(__name__)
 
+# WS status values treated as connected (statuses are stored lowercase)
+_BINANCE_OK = frozenset({
+    "websocket connected", "binance ws connected", "connected",
+    "live", "open", "connecting…", "subscription sent"
+})
+_KRAKEN_OK = frozenset({
+    "websocket connected", "kraken subscription sent", "connected",
+    "live", "open", "connecting…", "subscription sent"
+})
+
+# 1-slot memo for get_ws_color (inputs change only on connection transitions)
+_ws_color_key = None
+_ws_color = RED
+
+# SysFont scans system font paths on every call → keep one Font per (name, size, bold)
+_FONT_CACHE: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+# Rendered adaptive text surfaces (LRU, render thread only)
+_TEXT_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_TEXT_CACHE_MAX = 512
+
 def is_wifi_connected() -> bool:
     # Quick non-blocking internet check via DNS resolution.
     try:
@@ -32,47 +57,66 @@ def is_wifi_connected() -> bool:
     except OSError:
         return False
 
+def create_http_session(pool_size: int = 4) -> requests.Session:
+    # Keep-alive session reused across polls (avoids a TCP/TLS handshake per request).
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "rpi-crypto-ticker-display/1.0"})
+    return session
+
 def get_ws_color() -> Tuple[int, int, int]:
     # Determine global connection status color:
     #  - RED:    no WiFi
     #  - GREEN:  both WS connected
     #  - ORANGE: at least one WS connected
     # Updates WiFi status periodically.
-    global wifi_ok, last_wifi_check
+    global wifi_ok, last_wifi_check, _ws_color_key, _ws_color
     now = time.time()
 
     if now - last_wifi_check > WIFI_CHECK_INTERVAL:
         wifi_ok = is_wifi_connected()
         last_wifi_check = now
 
-    # Debug log (only when checked)
-    logger.debug(
-        f"WS indicator → wifi_ok={wifi_ok} | binance='{binance_ws_status}' | kraken='{kraken_ws_status}'"
-    )
+    # Statuses are rebound by the WS threads → read through the module
+    binance_status = shared.binance_ws_status
+    kraken_status = shared.kraken_ws_status
+
+    key = (wifi_ok, binance_status, kraken_status)
+    if key == _ws_color_key:
+        return _ws_color
+
+    # Debug log (only on state transitions)
+    logger.debug("WS indicator → wifi_ok=%s | binance='%s' | kraken='%s'",
+                 wifi_ok, binance_status, kraken_status)
 
     if not wifi_ok:
-        return RED
-
-    # Loose matching for various connection states
-    binance_ok = binance_ws_status.lower() in [
-        "websocket connected", "binance ws connected", "connected",
-        "live", "open", "connecting…", "subscription sent"
-    ]
-    kraken_ok = kraken_ws_status.lower() in [
-        "websocket connected", "kraken subscription sent", "connected",
-        "live", "open", "connecting…", "subscription sent"
-    ]
-
-    if binance_ok and kraken_ok:
-        return GREEN
-    if binance_ok or kraken_ok:
-        return ORANGE
-    return RED
+        color = RED
+    else:
+        # Loose matching for various connection states
+        binance_ok = binance_status in _BINANCE_OK
+        kraken_ok = kraken_status in _KRAKEN_OK
+
+        if binance_ok and kraken_ok:
+            color = GREEN
+        elif binance_ok or kraken_ok:
+            color = ORANGE
+        else:
+            color = RED
+
+    _ws_color_key = key
+    _ws_color = color
+    return color
 
+# Formatters are memoized: the render loop calls them every frame with values
+# that only change on miner/mempool updates.
+@lru_cache(maxsize=256)
 def format_hashrate(th: float) -> str:
     # Format hashrate in TH/s with 2 decimals.
     return f"{th:.2f} TH/s"
 
+@lru_cache(maxsize=256)
 def format_difficulty(diff: float) -> str:
     # Human-readable difficulty with appropriate unit (K/M/G/T).
     if diff >= 1e12: return f"{diff / 1e12:.2f} T"
@@ -81,6 +125,7 @@ def format_difficulty(diff: float) -> str:
     if diff >= 1e3:  return f"{diff / 1e3:.2f} K"
     return f"{diff:.0f}"
 
+@lru_cache(maxsize=256)
 def format_network_hashrate(hr_eh: float) -> str:
     # Format network hashrate starting from EH/s with dynamic scaling.
     if hr_eh <= 0:
@@ -101,13 +146,13 @@ def format_network_hashrate(hr_eh: float) -> str:
 
 def prices_changed_for_marquee() -> bool:
     # Check if any marquee symbol price changed since last rebuild.
-    with data_lock:
-        for sym in MARQUEE_SYMBOLS:
-            key = sym.lower()
-            current = data[key].last_marquee_price
-            previous = last_known_marquee_prices.get(key)
-            if current != previous:
-                return True
+    # Lock-free: attribute reads are atomic; a racing update is caught next frame.
+    for key in MARQUEE_KEYS:
+        ticker = data.get(key)
+        if ticker is None:
+            continue
+        if ticker.last_marquee_price != last_known_marquee_prices.get(key):
+            return True
     return False
 
 def update_ticker_data(key: str, price: float, change: float, update_marquee: bool = True):
@@ -123,35 +168,59 @@ def update_ticker_data(key: str, price: float, change: float, update_marquee: bo
         if update_marquee:
             ticker.last_marquee_price = price
 
+        # Live candle layout: [start, open, high, low, close]
         candle = ticker.current_candle
-        if candle is None or now - candle["start"] >= CANDLE_SECONDS:
+        if candle is None or now - candle[0] >= CANDLE_SECONDS:
             if candle:
-                ticker.candles.append(candle)
-            ticker.current_candle = {
-                "start": int(now),
-                "open": price,
-                "high": price,
-                "low": price,
-                "close": price
-            }
+                ticker.candles.append(Candle._make(candle))
+                ticker.rebuild_candle_columns()
+            ticker.current_candle = [int(now), price, price, price, price]
         else:
-            candle["high"] = max(candle["high"], price)
-            candle["low"] = min(candle["low"], price)
-            candle["close"] = price
+            if price > candle[2]:
+                candle[2] = price
+            elif price < candle[3]:
+                candle[3] = price
+            candle[4] = price
+
+def _get_font(font_name: str, size: int, bold: bool) -> pygame.font.Font:
+    # Return cached SysFont instance, creating it on first use.
+    key = (font_name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = pygame.font.SysFont(font_name, size, bold=bold)
+        _FONT_CACHE[key] = font
+    return font
 
 def render_adaptive_text(text: str, max_width: int, color: Tuple[int, int, int],
                          start_size: int = 14, min_size: int = 8,
                          font_name: str = "dejavusans", bold: bool = False) -> pygame.Surface:
     # Render text by reducing font size until it fits max_width.
     # Returns smallest acceptable surface (fallback to min_size).
-    size = start_size
-    while size >= min_size:
-        font = pygame.font.SysFont(font_name, size, bold=bold)
-        surf = font.render(text, True, color)
-        if surf.get_width() <= max_width:
-            return surf
-        size -= 1
-
-    # Fallback to minimum size
-    font = pygame.font.SysFont(font_name, min_size, bold=bold)
-    return font.render(text, True, color)
+    # Results are memoized: callers only blit the returned surface, never modify it.
+    key = (text, max_width, color, start_size, min_size, font_name, bold)
+    surf = _TEXT_CACHE.get(key)
+    if surf is not None:
+        _TEXT_CACHE.move_to_end(key)
+        return surf
+
+    surf = _fit_text(text, max_width, color, start_size, min_size, font_name, bold)
+    _TEXT_CACHE[key] = surf
+    if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+        _TEXT_CACHE.popitem(last=False)
+    return surf
+
+def _fit_text(text: str, max_width: int, color: Tuple[int, int, int],
+              start_size: int, min_size: int, font_name: str, bold: bool) -> pygame.Surface:
+    # Binary search for the largest size whose metrics fit max_width,
+    # then rasterize once at that size (fallback to min_size).
+    lo, hi = min_size, start_size
+    best = min_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if _get_font(font_name, mid, bold).size(text)[0] <= max_width:
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+
+    return _get_font(font_name, best, bold).render(text, True, color).convert_alpha()
@@ -5,26 +5,53 @@ Polls every 15 seconds in parallel using ThreadPoolExecutor.
 If no miners configured, thread exits immediately.
 """
 import time
+import json
 import logging
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import http.client
+from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
 
 from src.constants import MINER_ACTIVE_THRESHOLD
-from src.data import miner_stats, miners_lock, hash_history
+import src.data as shared
+from src.data import hash_history, stop_event
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive HTTPConnection per miner IP, reused across polling cycles.
+# Each IP is fetched by a single worker per cycle, so connections are never shared.
+_conns: Dict[str, http.client.HTTPConnection] = {}
+_HEADERS = {"User-Agent": "rpi-crypto-ticker-display/1.0"}
+
+def _get_system_info(ip: str) -> Dict[str, Any]:
+    # GET /api/system/info over the cached connection.
+    # A reused connection may have been closed by the miner while idle:
+    # drop it and retry once on a fresh one.
+    for attempt in range(2):
+        conn = _conns.get(ip)
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPConnection(ip, timeout=4)
+            _conns[ip] = conn
+        try:
+            conn.request("GET", "/api/system/info", headers=_HEADERS)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            _conns.pop(ip, None)
+            if reused and attempt == 0:
+                continue
+            raise
+
+        if resp.status != 200:
+            raise http.client.HTTPException(f"HTTP {resp.status} from {ip}")
+        return json.loads(body)
+
 def fetch_miner_stats(ip: str) -> tuple[float, float, bool]:
     # Query miner API for current hashrate (TH/s), best share difficulty, and connection status.
     # Returns (hashrate_th, best_diff, connected: bool)
     try:
-        resp = requests.get(
-            f"http://{ip}/api/system/info",
-            timeout=4,
-            headers={"User-Agent": "rpi-crypto-ticker-display/1.0"}
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_system_info(ip)
 
         # API returns hashRate in GH/s → convert to TH/s
         hr_th = data.get("hashRate", 0.0) / 1000.0
@@ -35,11 +62,30 @@ def fetch_miner_stats(ip: str) -> tuple[float, float, bool]:
         # Silent failure → treat as disconnected / 0 stats
         return 0.0, 0.0, False
 
+def _reduce_miners(results: list[tuple[float, float, bool]],
+                   threshold: float) -> tuple[float, float, int, int]:
+    # Single-pass reduction of per-miner results.
+    # Returns (total_hashrate_th, best_diff, connected_count, active_count)
+    total_hr = 0.0
+    best_diff = 0.0
+    conn_count = 0
+    act_count = 0
+    for hr, diff, connected in results:
+        total_hr += hr
+        if diff > best_diff:
+            best_diff = diff
+        if connected:
+            conn_count += 1
+        if hr > threshold:
+            act_count += 1
+    return total_hr, best_diff, conn_count, act_count
+
 def run_miners_polling(miners_ips: list[str]):
     # Main polling loop.
     # Exits early if miners_ips is empty.
     # Uses thread pool for concurrent fetches (max 16 workers → safe for RPi).
-    # Updates shared miner_stats and hash_history thread-safely.
+    # Appends to hash_history and publishes a fresh snapshot (with a copy of it).
+    # Returns when stop_event is set.
     if not miners_ips:
         logger.info("No miners configured - miner polling thread exiting")
         return
@@ -47,33 +93,34 @@ def run_miners_polling(miners_ips: list[str]):
     total_miners = len(miners_ips)
     logger.info(f"Starting miner polling for {total_miners} IPs")
 
-    with ThreadPoolExecutor(max_workers=16) as executor:
-        while True:
-            # Submit all fetches concurrently
-            futures = {executor.submit(fetch_miner_stats, ip): ip for ip in miners_ips}
-
-            total_hr = 0.0
-            best_diff = 0.0
-            conn_count = 0
-            act_count = 0
-
-            for future in as_completed(futures):
-                hr, diff, connected = future.result()
-                total_hr += hr
-                best_diff = max(best_diff, diff)
-                if connected:
-                    conn_count += 1
-                if hr > MINER_ACTIVE_THRESHOLD:
-                    act_count += 1
-
-            # Thread-safe update of global stats
-            with miners_lock:
-                miner_stats.update({
-                    "total_hashrate_th": total_hr,
-                    "best_difficulty": best_diff,
-                    "connected_count": conn_count,
-                    "active_count": act_count,
-                })
-                hash_history.append(total_hr)
-
-            time.sleep(15)
+    with ThreadPoolExecutor(max_workers=min(16, total_miners)) as executor:
+        next_tick = time.monotonic()
+        rev = 0
+        while not stop_event.is_set():
+            # Fetch all miners concurrently (results in input order)
+            results = list(executor.map(fetch_miner_stats, miners_ips))
+
+            total_hr, best_diff, conn_count, act_count = _reduce_miners(
+                results, MINER_ACTIVE_THRESHOLD
+            )
+
+            hash_history.append(total_hr)
+
+            # Publish by replacing the snapshot (atomic reference swap, no lock)
+            rev += 1
+            shared.miner_stats_snapshot = {
+                "rev": rev,
+                "total_hashrate_th": total_hr,
+                "best_difficulty": best_diff,
+                "connected_count": conn_count,
+                "active_count": act_count,
+                "total_miners": total_miners,
+                "hash_history": tuple(hash_history),
+                "hash_min": min(hash_history),
+                "hash_max": max(hash_history),
+            }
+
+            # Fixed cadence from a monotonic schedule; wakes immediately on shutdown
+            next_tick = max(next_tick + 15, time.monotonic())
+            if stop_event.wait(next_tick - time.monotonic()):
+                return
@@ -9,21 +9,24 @@ import time
 import logging
 import atexit
 import pygame
+from bisect import bisect_left
+from itertools import accumulate, islice
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from src.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DIM_ALPHA,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IDLE_FPS, DIM_ALPHA,
     BLACK, GRID_COLOR, WHITE, GREEN, RED, GRAY, ORANGE, BLUE,
     CHART_X, CHART_Y, CHART_W, CHART_H,
     MARQUEE_HEIGHT, MARQUEE_Y, MARQUEE_SPEED,
     MAIN_SYMBOLS, DATA_TIMEOUT, HASHRATE_CURVE_THICKNESS,
     MEMPOOL_MIN_LEFT_X, MEMPOOL_MAX_WIDTH,
-    MARQUEE_REFRESH_INTERVAL, MARQUEE_SYMBOLS, PRICE_DECIMALS
+    MARQUEE_REFRESH_INTERVAL, MARQUEE_SYMBOLS, PRICE_DECIMALS,
+    MAIN_KEYS, MARQUEE_KEYS
 )
+import src.data as shared
 from src.data import (
-    data, data_lock, miner_stats, miners_lock, hash_history,
-    mempool_data, fees_lock,
-    last_known_marquee_prices,
-    binance_ws_status, kraken_ws_status
+    data, data_lock, last_known_marquee_prices
 )
 from src.helpers import (
     get_ws_color, format_hashrate, format_difficulty, format_network_hashrate,
@@ -36,16 +39,41 @@ logger = logging.getLogger(__name__)
 screen = None
 render_surface = None
 BG_SURFACE = None
-DIM_LAYER = None
-logos_dict = None
-clock = None
 FONT_BIG = None
 FONT_MID = None
 FONT_SMALL = None
 FONT_HASHRATE = None
 FONT_MARQUEE = None
 
-# Scaling / offset for HDMI displays (preserves aspect ratio)
+# Logos: converted originals per symbol key + display-format scaled copies per size
+LOGO_SIZE = 24
+_logo_sources: Dict[str, pygame.Surface] = {}
+_logo_cache: Dict[Tuple[str, int], pygame.Surface] = {}
+
+# Marquee surfaces that never change, built once in init_pygame:
+# "sep" → separator, key → ("NAME " label, "NAME ---" placeholder)
+_STATIC_MARQUEE: Dict[str, Any] = {}
+
+# Per-symbol marquee segment from the last rebuild:
+# key → ((price text, color) or None, ((surface, width), ...), segment width)
+_marquee_segments: Dict[str, Tuple[Optional[Tuple[str, Tuple[int, int, int]]], tuple, int]] = {}
+
+# Last rendered surface per fixed text slot: slot → ((text, color), surface)
+_slot_cache: Dict[str, Tuple[Tuple[str, Tuple[int, int, int]], pygame.Surface]] = {}
+
+# Seconds without data changes before the render loop drops to IDLE_FPS
+IDLE_AFTER = 2.0
+
+# Screen zones (render coordinates) presented independently via dirty rects
+ZONE_RECTS = {
+    "header":  pygame.Rect(0, 0, SCREEN_WIDTH, 48),                        # logo, miners/clock, WS dot
+    "info":    pygame.Rect(0, 48, SCREEN_WIDTH, CHART_Y - 2 - 48),         # mempool line, price, change
+    "chart":   pygame.Rect(0, CHART_Y - 2, SCREEN_WIDTH, MARQUEE_Y - CHART_Y + 2),
+    "marquee": pygame.Rect(0, MARQUEE_Y, SCREEN_WIDTH, MARQUEE_HEIGHT),
+}
+
+# Scaling / offset for HDMI displays (preserves aspect ratio).
+# Only used when the SCALED display mode is unavailable (software fallback).
 display_width = SCREEN_WIDTH
 display_height = SCREEN_HEIGHT
 render_width = SCREEN_WIDTH
@@ -56,7 +84,7 @@ offset_y = 0
 
 def init_pygame(btc_logo_path: str):
     # Initialize Pygame, detect display, set up surfaces, fonts, and logos.
-    global screen, render_surface, BG_SURFACE, DIM_LAYER, logos_dict, clock
+    global screen, render_surface, BG_SURFACE
     global FONT_BIG, FONT_MID, FONT_SMALL, FONT_HASHRATE, FONT_MARQUEE
     global display_width, display_height, render_width, render_height
     global scale_factor, offset_x, offset_y
@@ -66,55 +94,72 @@ def init_pygame(btc_logo_path: str):
     real_width, real_height = info.current_w, info.current_h
     logger.info(f"Detected display: {real_width} × {real_height}")
 
-    # Calculate scaling to fit 480×320 natively while preserving aspect
-    scale_w = real_width / render_width
-    scale_h = real_height / render_height
-    scale_factor = min(scale_w, scale_h)
-    display_width = int(render_width * scale_factor)
-    display_height = int(render_height * scale_factor)
-    offset_x = (real_width - display_width) // 2
-    offset_y = (real_height - display_height) // 2
-
     try:
+        # 480×320 logical display: SDL scales it to the real screen on present
+        # (hardware scaling, aspect preserved), so no per-frame software rescale
         screen = pygame.display.set_mode(
-            (real_width, real_height),
-            pygame.FULLSCREEN | pygame.NOFRAME
+            (render_width, render_height),
+            pygame.FULLSCREEN | pygame.SCALED
         )
-    except Exception as e:
-        logger.critical(f"Display init failed: {e}")
-        raise SystemExit(1)
+        scale_factor = 1.0
+    except pygame.error as e:
+        logger.warning(f"SCALED display mode unavailable ({e}) → software scaling")
+
+        # Calculate scaling to fit 480×320 natively while preserving aspect
+        scale_w = real_width / render_width
+        scale_h = real_height / render_height
+        scale_factor = min(scale_w, scale_h)
+        display_width = int(render_width * scale_factor)
+        display_height = int(render_height * scale_factor)
+        offset_x = (real_width - display_width) // 2
+        offset_y = (real_height - display_height) // 2
+
+        try:
+            screen = pygame.display.set_mode(
+                (real_width, real_height),
+                pygame.FULLSCREEN | pygame.NOFRAME
+            )
+        except Exception as e:
+            logger.critical(f"Display init failed: {e}")
+            raise SystemExit(1)
 
     pygame.mouse.set_visible(False)
-    clock = pygame.time.Clock()
 
-    render_surface = pygame.Surface((render_width, render_height))
-    BG_SURFACE = pygame.Surface((render_width, render_height))
+    # All static/intermediate surfaces in display pixel format → blits are plain copies
+    render_surface = pygame.Surface((render_width, render_height)).convert()
+    BG_SURFACE = pygame.Surface((render_width, render_height)).convert()
     BG_SURFACE.fill(BLACK)
 
-    # Draw grid lines on static background
+    # Static background (fill, chart grid, marquee bar); dirty zones are cleared from it
     for i in range(1, 4):
         y = CHART_Y + i * (CHART_H / 4)
         pygame.draw.line(BG_SURFACE, GRID_COLOR,
                          (CHART_X + 4, y), (CHART_X + CHART_W - 4, y), 1)
 
-    DIM_LAYER = pygame.Surface((render_width, render_height))
-    DIM_LAYER.fill((0, 0, 0))
-    DIM_LAYER.set_alpha(DIM_ALPHA)
+    # Marquee bar background (outside the dim layer, so never dimmed)
+    pygame.draw.rect(BG_SURFACE, (18, 18, 28), (0, MARQUEE_Y, render_width, MARQUEE_HEIGHT))
 
-    # Load logos for main symbols
+    # Dim layer covers everything above the marquee bar: baked into the background
+    # once, widgets above it are drawn with dim() colors and pre-dimmed logos
+    dim_layer = pygame.Surface((render_width, MARQUEE_Y)).convert()
+    dim_layer.fill((0, 0, 0))
+    dim_layer.set_alpha(DIM_ALPHA)
+    BG_SURFACE.blit(dim_layer, (0, 0))
+
+    # Load logos for main symbols (btc_logo_path overrides the BTC logo)
     project_root = os.path.dirname(os.path.dirname(__file__))
-    logos_dict = {}
-    for symbol in MAIN_SYMBOLS:
+    for symbol, key in zip(MAIN_SYMBOLS, MAIN_KEYS):
         logo_name = symbol.replace("USDT", "").lower() + ".png"
-        full_path = os.path.join(project_root, "logos", logo_name)
+        if key == "btcusdt" and btc_logo_path:
+            full_path = os.path.join(project_root, btc_logo_path)
+        else:
+            full_path = os.path.join(project_root, "logos", logo_name)
         try:
-            logo = pygame.image.load(full_path).convert_alpha()
-            logo = pygame.transform.smoothscale(logo, (24, 24))
-            logos_dict[symbol.lower()] = logo
+            _logo_sources[key] = pygame.image.load(full_path).convert_alpha()
         except Exception:
             logger.warning(f"Logo load failed: {logo_name}")
-            fallback = pygame.Surface((24, 24), pygame.SRCALPHA)
-            logos_dict[symbol.lower()] = fallback
+            _logo_sources[key] = pygame.Surface((LOGO_SIZE, LOGO_SIZE), pygame.SRCALPHA).convert_alpha()
+        get_logo(key, LOGO_SIZE)  # pre-scale the header size
 
     # Font loading with DejaVu fallback to system default
     font_regular = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
@@ -133,59 +178,135 @@ def init_pygame(btc_logo_path: str):
         FONT_HASHRATE = pygame.font.Font(None, 17)
         FONT_MARQUEE = pygame.font.Font(None, 21)
 
+    _build_static_marquee(FONT_MARQUEE)
+
+def _build_static_marquee(font_marquee):
+    # Pre-render separator, name labels and "---" placeholders (price-independent).
+    def render(text, color):
+        surf = font_marquee.render(text, True, color).convert_alpha()
+        return surf, surf.get_width()
+
+    _STATIC_MARQUEE["sep"] = render(" • ", (140, 140, 140))
+    for symbol, key in zip(MARQUEE_SYMBOLS, MARQUEE_KEYS):
+        name = symbol.upper().replace("USDT", "").replace("USD", "")
+        if symbol == "RUNECOIN":
+            name = "RUNECOIN"
+        _STATIC_MARQUEE[key] = (render(f"{name} ", WHITE), render(f"{name} ---", GRAY))
+
+def get_logo(symbol_key: str, size: int = LOGO_SIZE) -> Optional[pygame.Surface]:
+    # Logo scaled to size×size in display pixel format, scaled once and cached.
+    logo = _logo_cache.get((symbol_key, size))
+    if logo is None:
+        source = _logo_sources.get(symbol_key)
+        if source is None:
+            return None
+        logo = pygame.transform.smoothscale(source, (size, size)).convert_alpha()
+        # Same darkening as the dim layer (alpha channel untouched)
+        level = 255 - DIM_ALPHA
+        logo.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
+        _logo_cache[(symbol_key, size)] = logo
+    return logo
+
+@lru_cache(maxsize=None)
+def dim(color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    # Color as it looks under the black DIM_ALPHA layer (blending is linear, so
+    # drawing with dimmed colors matches dimming the finished zone).
+    factor = (255 - DIM_ALPHA) / 255
+    return tuple(int(c * factor) for c in color)
+
 def cleanup():
     # Pygame shutdown on exit
     if pygame.get_init():
         pygame.quit()
 
+def render_slot(slot: str, font: pygame.font.Font, text: str,
+                color: Tuple[int, int, int]) -> pygame.Surface:
+    # Render text for a fixed screen slot, reusing the previous surface while
+    # text and color are unchanged (most frames repeat the same values).
+    key = (text, color)
+    cached = _slot_cache.get(slot)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    surf = font.render(text, True, color).convert_alpha()
+    _slot_cache[slot] = (key, surf)
+    return surf
+
 def create_marquee_surfaces(font_marquee):
     # Build list of marquee text surfaces + total width (doubled for seamless loop).
+    # Segments are rebuilt only for symbols whose displayed price text or color
+    # changed; the rest (and their widths) are reused from the previous rebuild.
     parts = []
-    separator = font_marquee.render(" • ", True, (140, 140, 140))
-    name_template = lambda t: font_marquee.render(t, True, WHITE)
-    price_template = lambda t, c: font_marquee.render(t, True, c)
-    na_template = lambda t: font_marquee.render(t, True, GRAY)
+    total_width = 0
+    separator = _STATIC_MARQUEE["sep"]
 
     with data_lock:
-        for symbol in MARQUEE_SYMBOLS:
-            key = symbol.lower()
-            name = symbol.upper().replace("USDT", "").replace("USD", "")
-            if symbol == "RUNECOIN":
-                name = "RUNECOIN"
+        for key in MARQUEE_KEYS:
             ticker = data[key]
-
             if ticker.price is not None:
                 decimals = PRICE_DECIMALS.get(key, 4 if ticker.price < 10 else 2)
-                price_str = f"{ticker.price:,.{decimals}f}"
-                color = GREEN if ticker.change_24h >= 0 else RED
-                parts.extend([
-                    (name_template(f"{name} "), name_template(f"{name} ").get_width()),
-                    (price_template(f"${price_str}", color), price_template(f"${price_str}", color).get_width())
-                ])
+                shown = (f"${ticker.price:,.{decimals}f}", GREEN if ticker.change_24h >= 0 else RED)
             else:
-                na_surf = na_template(f"{name} ---")
-                parts.append((na_surf, na_surf.get_width()))
+                shown = None
 
-            parts.append((separator, separator.get_width()))
+            cached = _marquee_segments.get(key)
+            if cached is None or cached[0] != shown:
+                label, placeholder = _STATIC_MARQUEE[key]
+                if shown is not None:
+                    price_surf = font_marquee.render(shown[0], True, shown[1]).convert_alpha()
+                    segment = (label, (price_surf, price_surf.get_width()), separator)
+                else:
+                    segment = (placeholder, separator)
+                cached = (shown, segment, sum(w for _, w in segment))
+                _marquee_segments[key] = cached
 
-    doubled = parts + parts
-    total_width = sum(w for _, w in doubled)
-    return doubled, total_width
+            parts.extend(cached[1])
+            total_width += cached[2]
+
+    return parts + parts, total_width * 2
 
 def run_render_loop():
     # Main render loop: 25 FPS cap, event handling, dynamic updates, blitting.
-    global last_known_marquee_prices
-
     atexit.register(cleanup)
 
     local_surfaces = []
+    local_ends = []  # right edge of each marquee surface relative to marquee_x
     local_total_width = 0
+    marquee_rev = 0
     last_marquee_rebuild = 0
     current_symbol_idx = 0
     last_symbol_switch = time.time()
     symbol_switch_interval = 0 if len(MAIN_SYMBOLS) <= 1 else 21.0
     marquee_x = float(render_width)
 
+    # Per-zone content keys from the last redraw; a zone is redrawn and presented
+    # only when its key changes (the rest of render_surface is left untouched)
+    prev_zone_keys = {}
+    prev_upper_state = None
+
+    # Miner header text/color and mempool line, rebuilt only when the
+    # corresponding snapshot "rev" changes
+    miner_rev = None
+    miner_color = None
+    miner_text = ""
+    mempool_rev = None
+    mempool_text = ""
+    mempool_color = GRAY
+    # Last fitted mempool line surface and the (text, color) it was built from
+    top_surf = None
+    top_surf_key = None
+    # Hashrate curve overlay and the (miner rev, color) it was drawn for
+    hr_curve_surf = None
+    hr_curve_key = None
+
+    # Frame pacing on a monotonic deadline (sleeps instead of waiting on VSync).
+    # After IDLE_AFTER seconds without data changes the loop drops to IDLE_FPS;
+    # the marquee step scales with the interval so its speed (px/s) is unchanged.
+    frame_interval = 1.0 / FPS
+    idle_interval = 1.0 / min(IDLE_FPS, FPS)
+    interval = frame_interval
+    next_frame = time.monotonic()
+    last_change = next_frame
+
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -199,207 +320,308 @@ def run_render_loop():
             current_symbol_idx = (current_symbol_idx + 1) % len(MAIN_SYMBOLS)
             last_symbol_switch = now
 
-        current_symbol = MAIN_SYMBOLS[current_symbol_idx].lower()
-        with data_lock:
-            ticker = data.get(current_symbol)
+        current_symbol = MAIN_KEYS[current_symbol_idx]
+        ticker = data.get(current_symbol)
 
         # Rebuild marquee only when needed (interval or price change)
-        if now - last_marquee_rebuild >= MARQUEE_REFRESH_INTERVAL or prices_changed_for_marquee():
+        marquee_prices_moved = prices_changed_for_marquee()
+        if marquee_prices_moved:
+            last_change = time.monotonic()
+        if marquee_prices_moved or now - last_marquee_rebuild >= MARQUEE_REFRESH_INTERVAL:
             local_surfaces, local_total_width = create_marquee_surfaces(FONT_MARQUEE)
-            with data_lock:
-                last_known_marquee_prices = {k.lower(): data[k.lower()].last_marquee_price for k in MARQUEE_SYMBOLS}
+            local_ends = list(accumulate(w for _, w in local_surfaces))
+            marquee_rev += 1
+            # Update the shared dict in place (prices_changed_for_marquee reads it)
+            last_known_marquee_prices.update(
+                (k, data[k].last_marquee_price) for k in MARQUEE_KEYS
+            )
             last_marquee_rebuild = now
 
-        marquee_x -= MARQUEE_SPEED
+        marquee_x -= MARQUEE_SPEED * interval * FPS
         if local_total_width > 0 and marquee_x <= -(local_total_width / 2):
             marquee_x += local_total_width / 2
 
-        render_surface.blit(BG_SURFACE, (0, 0))
-
-        # Logo + symbol name (top-left)
-        logo = logos_dict.get(current_symbol)
-        if logo is not None:
-            render_surface.blit(logo, (9, 9))
-            ticker_name = current_symbol.replace("usdt", "").upper()
-            if current_symbol == "runecoin":
-                ticker_name = "RUNECOIN"
-            name_surf = FONT_SMALL.render(ticker_name, True, WHITE)
-            name_x = 9 + 24 + 6
-            name_y = 9 + 12 - (name_surf.get_height() // 2)
-            render_surface.blit(name_surf, (name_x, name_y))
-
-        # Miner stats or clock (top-right)
-        with miners_lock:
-            total_hr = miner_stats.get("total_hashrate_th", 0)
-            best_diff = miner_stats.get("best_difficulty", 0)
-            conn_count = miner_stats.get("connected_count", 0)
-            active_count = miner_stats.get("active_count", 0)
-        total_miners = miner_stats.get("total_miners", 0)
-
-        if total_miners > 0:
-            hr_str = format_hashrate(total_hr)
-            diff_str = format_difficulty(best_diff)
-
-            if conn_count == total_miners and active_count == total_miners:
-                miner_color = BLUE
-            elif conn_count > 0:
-                miner_color = ORANGE
-            else:
-                miner_color = RED
-
-            miner_surf = FONT_HASHRATE.render(f"{hr_str} - {diff_str}", True, miner_color)
-            miner_x = render_width - 25 - miner_surf.get_width()
-            render_surface.blit(miner_surf, (miner_x, 9))
-
-            # Hashrate curve overlay (semi-transparent)
-            hr_values = list(hash_history)
-            if len(hr_values) > 1:
-                min_hr = min(hr_values)
-                max_hr = max(hr_values)
-                hr_range = max(max_hr - min_hr, 0.001)
-
-                def hr_to_y(h: float) -> int:
-                    norm = (h - min_hr) / hr_range
-                    return CHART_Y + CHART_H - int(norm * CHART_H)
-
-                line_surf = pygame.Surface((CHART_W, CHART_H), pygame.SRCALPHA)
-                points = []
-                for i, hr in enumerate(hr_values):
-                    x = int((i / (len(hr_values) - 1)) * (CHART_W - 1))
-                    y = hr_to_y(hr) - CHART_Y
-                    points.append((x, y))
-
-                if points:
-                    pygame.draw.lines(line_surf, miner_color, False, points, HASHRATE_CURVE_THICKNESS)
-                line_surf.set_alpha(128)
-                render_surface.blit(line_surf, (CHART_X, CHART_Y))
-        else:
-            # Show current time instead
-            time_str = time.strftime('%H:%M', time.localtime(now))
-            time_surf = FONT_HASHRATE.render(time_str, True, WHITE)
-            time_x = render_width - 25 - time_surf.get_width()
-            render_surface.blit(time_surf, (time_x, 9))
+        dirty = []
 
-        # Connection status dot (top-right)
+        # Lock-free reads: the snapshot dicts are replaced, never mutated
+        stats = shared.miner_stats_snapshot
+        mempool = shared.mempool_snapshot
         ws_color = get_ws_color()
-        indicator_y = 9 + FONT_HASHRATE.get_height() // 2 + 1
-        pygame.draw.circle(render_surface, ws_color, (render_width - 16, indicator_y), 4)
-
-        # Mempool/network info (BTC only, centered)
-        if current_symbol == "btcusdt":
-            with fees_lock:
-                fees = mempool_data.get("fees_sats_vb")
-                height = mempool_data.get("block_height")
-                pool = mempool_data.get("mining_pool")
-                net_hr = mempool_data.get("network_hashrate_eh")
-                net_diff = mempool_data.get("network_difficulty")
-
-            if fees is not None and height is not None:
-                parts = [f"{fees:.1f} sat/vB", str(height)]
-                if pool:
-                    parts.append(pool)
-                if net_hr is not None:
-                    parts.append(format_network_hashrate(net_hr))
-                if net_diff is not None:
-                    parts.append(format_difficulty(net_diff))
-                top_text = " | ".join(parts)
+        live = (ticker and ticker.price is not None and ticker.last_update is not None
+                and now - ticker.last_update < DATA_TIMEOUT)
+
+        # Raw inputs of the header/info/chart zones. When none changed, skip building
+        # their keys and strings entirely: only the marquee scrolls this frame.
+        current_candle = ticker.current_candle if ticker else None
+        upper_state = (
+            current_symbol, stats["rev"], mempool["rev"], ws_color, live,
+            ticker.price if ticker else None,
+            ticker.change_24h if ticker else None,
+            ticker.status if ticker else None,
+            ticker.candle_columns if ticker else None,
+            tuple(current_candle) if current_candle else None,
+            int(now // 60) if stats["total_miners"] == 0 else None,  # clock minute
+        )
+
+        if upper_state != prev_upper_state:
+            last_change = time.monotonic()
+
+            # --- Header zone: logo + symbol name, miner stats or clock, connection dot ---
+            total_miners = stats["total_miners"]
+
+            if total_miners > 0:
+                if stats["rev"] != miner_rev:
+                    conn_count = stats["connected_count"]
+                    active_count = stats["active_count"]
+                    if conn_count == total_miners and active_count == total_miners:
+                        miner_color = BLUE
+                    elif conn_count > 0:
+                        miner_color = ORANGE
+                    else:
+                        miner_color = RED
+
+                    hr_str = format_hashrate(stats["total_hashrate_th"])
+                    diff_str = format_difficulty(stats["best_difficulty"])
+                    miner_text = f"{hr_str} - {diff_str}"
+                    miner_rev = stats["rev"]
+
+                top_right_text = miner_text
+                top_right_color = miner_color
+            else:
+                # Show current time instead
+                top_right_text = time.strftime('%H:%M', time.localtime(now))
+                top_right_color = WHITE
+
+            header_key = (current_symbol, top_right_text, top_right_color, ws_color)
+            if header_key != prev_zone_keys.get("header"):
+                rect = ZONE_RECTS["header"]
+                render_surface.blit(BG_SURFACE, rect, rect)
+
+                # Logo + symbol name (top-left)
+                logo = get_logo(current_symbol)
+                if logo is not None:
+                    render_surface.blit(logo, (9, 9))
+                    ticker_name = current_symbol.replace("usdt", "").upper()
+                    if current_symbol == "runecoin":
+                        ticker_name = "RUNECOIN"
+                    name_surf = render_slot("name", FONT_SMALL, ticker_name, dim(WHITE))
+                    name_x = 9 + LOGO_SIZE + 6
+                    name_y = 9 + LOGO_SIZE // 2 - (name_surf.get_height() // 2)
+                    render_surface.blit(name_surf, (name_x, name_y))
+
+                # Miner stats or clock (top-right)
+                top_right_surf = render_slot("top_right", FONT_HASHRATE, top_right_text, dim(top_right_color))
+                top_right_x = render_width - 25 - top_right_surf.get_width()
+                render_surface.blit(top_right_surf, (top_right_x, 9))
+
+                # Connection status dot (top-right)
+                indicator_y = 9 + FONT_HASHRATE.get_height() // 2 + 1
+                pygame.draw.circle(render_surface, dim(ws_color), (render_width - 16, indicator_y), 4)
+
+                dirty.append(rect)
+                prev_zone_keys["header"] = header_key
+
+            # --- Info zone: mempool/network line (BTC only), price and 24h change ---
+            if current_symbol == "btcusdt":
+                if mempool["rev"] != mempool_rev:
+                    fees = mempool["fees_sats_vb"]
+                    height = mempool["block_height"]
+                    pool = mempool["mining_pool"]
+                    net_hr = mempool["network_hashrate_eh"]
+                    net_diff = mempool["network_difficulty"]
+
+                    if fees is not None and height is not None:
+                        parts = [f"{fees:.1f} sat/vB", str(height)]
+                        if pool:
+                            parts.append(pool)
+                        if net_hr is not None:
+                            parts.append(format_network_hashrate(net_hr))
+                        if net_diff is not None:
+                            parts.append(format_difficulty(net_diff))
+                        mempool_text = " | ".join(parts)
+                        mempool_color = WHITE
+                    else:
+                        mempool_text = "Loading network data…"
+                        mempool_color = GRAY
+                    mempool_rev = mempool["rev"]
+
+                top_text = mempool_text
+                top_color = mempool_color
+            else:
+                top_text = ""
                 top_color = WHITE
+
+            if live:
+                price_str = f"${ticker.price:,.2f}"
+                change_color = GREEN if ticker.change_24h >= 0 else RED
+                arrow = "↑" if ticker.change_24h >= 0 else "↓"
+                change_text = f"{arrow} {ticker.change_24h:+.2f}%"
+                info_key = (current_symbol, top_text, top_color, price_str, change_text, change_color)
             else:
-                top_text = "Loading network data…"
-                top_color = GRAY
-        else:
-            top_text = ""
-            top_color = WHITE
-
-        top_surf = render_adaptive_text(top_text, MEMPOOL_MAX_WIDTH, top_color,
-                                        start_size=16, min_size=8, bold=False)
-        top_y = 48
-        top_x = (render_width - top_surf.get_width()) // 2
-        render_surface.blit(top_surf, (top_x, top_y))
-
-        # Price, change, candlesticks (center)
-        if (ticker and ticker.price is not None and ticker.last_update is not None
-                and now - ticker.last_update < DATA_TIMEOUT):
-            price_str = f"${ticker.price:,.2f}"
-            price_surf = FONT_BIG.render(price_str, True, WHITE)
-            price_y = 75 if current_symbol == "btcusdt" else 55
-            render_surface.blit(price_surf, ((render_width - price_surf.get_width()) // 2, price_y))
-
-            change_color = GREEN if ticker.change_24h >= 0 else RED
-            arrow = "↑" if ticker.change_24h >= 0 else "↓"
-            change_text = f"{arrow} {ticker.change_24h:+.2f}%"
-            change_surf = FONT_MID.render(change_text, True, change_color)
-            change_y = 142 if current_symbol == "btcusdt" else 122
-            render_surface.blit(change_surf, ((render_width - change_surf.get_width()) // 2, change_y))
-
-            # Candlestick chart
-            candles = list(ticker.candles)
-            if ticker.current_candle:
-                candles.append(ticker.current_candle)
-
-            if len(candles) > 1:
-                all_highs = [c["high"] for c in candles]
-                all_lows = [c["low"] for c in candles]
-                min_price = min(all_lows)
-                max_price = max(all_highs)
-                price_range = max(max_price - min_price, 0.001)
-                candle_width = CHART_W / len(candles)
-
-                def price_to_y(p: float) -> int:
-                    norm = (p - min_price) / price_range
-                    return CHART_Y + CHART_H - int(norm * CHART_H)
-
-                for i, candle in enumerate(candles):
-                    x_center = CHART_X + i * candle_width + candle_width / 2
-                    color_candle = GREEN if candle["close"] >= candle["open"] else RED
-
-                    # Wick
-                    pygame.draw.line(
-                        render_surface, WHITE,
-                        (x_center, price_to_y(candle["high"])),
-                        (x_center, price_to_y(candle["low"])),
-                        1
-                    )
-
-                    # Body
-                    open_y = price_to_y(candle["open"])
-                    close_y = price_to_y(candle["close"])
-                    top_y_c = min(open_y, close_y)
-                    height = max(3, abs(close_y - open_y))
-                    pygame.draw.rect(
-                        render_surface, color_candle,
-                        (x_center - candle_width * 0.28, top_y_c,
-                         candle_width * 0.56, height),
-                        border_radius=0
-                    )
-        else:
-            status_text = ticker.status if ticker else "No data"
-            status_surf = FONT_MID.render(status_text, True, GRAY)
-            render_surface.blit(status_surf, ((render_width - status_surf.get_width()) // 2, 140))
-
-        # Final overlays
-        render_surface.blit(DIM_LAYER, (0, 0))
-        pygame.draw.rect(render_surface, (18, 18, 28), (0, MARQUEE_Y, render_width, MARQUEE_HEIGHT))
-
-        # Scrolling marquee
-        current_pos = int(marquee_x)
-        for surf, width in local_surfaces:
-            if current_pos + width < 0:
+                status_text = ticker.status if ticker else "No data"
+                info_key = (current_symbol, top_text, top_color, status_text)
+
+            if info_key != prev_zone_keys.get("info"):
+                rect = ZONE_RECTS["info"]
+                render_surface.blit(BG_SURFACE, rect, rect)
+
+                # Fit only when the line changed: skips the LRU key hashing on price ticks
+                if (top_text, top_color) != top_surf_key:
+                    top_surf = render_adaptive_text(top_text, MEMPOOL_MAX_WIDTH, dim(top_color),
+                                                    start_size=16, min_size=8, bold=False)
+                    top_surf_key = (top_text, top_color)
+                top_y = 48
+                top_x = (render_width - top_surf.get_width()) // 2
+                render_surface.blit(top_surf, (top_x, top_y))
+
+                if live:
+                    price_surf = render_slot("price", FONT_BIG, price_str, dim(WHITE))
+                    price_y = 75 if current_symbol == "btcusdt" else 55
+                    render_surface.blit(price_surf, ((render_width - price_surf.get_width()) // 2, price_y))
+
+                    change_surf = render_slot("change", FONT_MID, change_text, dim(change_color))
+                    change_y = 142 if current_symbol == "btcusdt" else 122
+                    render_surface.blit(change_surf, ((render_width - change_surf.get_width()) // 2, change_y))
+                else:
+                    status_surf = render_slot("status", FONT_MID, status_text, dim(GRAY))
+                    render_surface.blit(status_surf, ((render_width - status_surf.get_width()) // 2, 140))
+
+                dirty.append(rect)
+                prev_zone_keys["info"] = info_key
+
+            # --- Chart zone: hashrate curve overlay + candlesticks ---
+            # Closed candles come pre-split into columns by the writer; only the live
+            # candle is copied per frame
+            columns = None
+            live_candle = None
+            if live:
+                columns = ticker.candle_columns
+                if ticker.current_candle:
+                    live_candle = tuple(ticker.current_candle[1:])
+            hr_values = stats["hash_history"] if miner_color is not None else None
+
+            chart_key = (columns, live_candle, hr_values, miner_color)
+            if chart_key != prev_zone_keys.get("chart"):
+                rect = ZONE_RECTS["chart"]
+                render_surface.blit(BG_SURFACE, rect, rect)
+
+                # Hashrate curve overlay (semi-transparent), re-rasterized only when a new
+                # miner snapshot arrives or the health color changes; price ticks reuse it
+                if hr_values and len(hr_values) > 1:
+                    curve_key = (stats["rev"], miner_color)
+                    if curve_key != hr_curve_key:
+                        # Bounds come precomputed with the snapshot (no extra passes here)
+                        min_hr = stats["hash_min"]
+                        hr_range = max(stats["hash_max"] - min_hr, 0.001)
+                        y_scale = CHART_H / hr_range
+                        x_step = (CHART_W - 1) / (len(hr_values) - 1)
+
+                        hr_curve_surf = pygame.Surface((CHART_W, CHART_H), pygame.SRCALPHA)
+                        points = [
+                            (int(i * x_step), CHART_H - int((hr - min_hr) * y_scale))
+                            for i, hr in enumerate(hr_values)
+                        ]
+                        pygame.draw.lines(hr_curve_surf, dim(miner_color), False, points, HASHRATE_CURVE_THICKNESS)
+                        hr_curve_surf = hr_curve_surf.convert_alpha()
+                        hr_curve_surf.set_alpha(128)
+                        hr_curve_key = curve_key
+                    render_surface.blit(hr_curve_surf, (CHART_X, CHART_Y))
+
+                # Candlestick chart
+                n_candles = 0
+                if columns:
+                    n_candles = len(columns.opens) + (1 if live_candle else 0)
+                if n_candles > 1:
+                    opens, highs, lows, closes, min_price, max_price = columns
+                    if live_candle:
+                        # Extend the writer's closed-candle bounds with the live candle only
+                        live_open, live_high, live_low, live_close = live_candle
+                        opens += (live_open,)
+                        highs += (live_high,)
+                        lows += (live_low,)
+                        closes += (live_close,)
+                        min_price = live_low if min_price is None else min(min_price, live_low)
+                        max_price = live_high if max_price is None else max(max_price, live_high)
+                    price_range = max(max_price - min_price, 0.001)
+                    candle_width = CHART_W / n_candles
+
+                    # Map every column to screen Y in one pass per column (scale hoisted out
+                    # of the loop instead of a per-point closure call)
+                    base_y = CHART_Y + CHART_H
+                    scale = CHART_H / price_range
+                    open_ys = [base_y - int((p - min_price) * scale) for p in opens]
+                    high_ys = [base_y - int((p - min_price) * scale) for p in highs]
+                    low_ys = [base_y - int((p - min_price) * scale) for p in lows]
+                    close_ys = [base_y - int((p - min_price) * scale) for p in closes]
+                    up_color, down_color, wick_color = dim(GREEN), dim(RED), dim(WHITE)
+                    body_half = candle_width * 0.28
+                    body_width = candle_width * 0.56
+
+                    # Two fills per candle: lock once so they don't each
+                    # lock/unlock the surface (no blits allowed until unlocked)
+                    render_surface.lock()
+                    try:
+                        for i, (open_y, high_y, low_y, close_y) in enumerate(zip(open_ys, high_ys, low_ys, close_ys)):
+                            x_center = CHART_X + i * candle_width + candle_width / 2
+                            color_candle = up_color if closes[i] >= opens[i] else down_color
+
+                            # Wick (1 px vertical fill: SDL fast path, no line rasterization)
+                            render_surface.fill(wick_color, (int(x_center), high_y, 1, low_y - high_y + 1))
+
+                            # Body (solid rect → plain SDL fill, same rect as draw.rect)
+                            top_y_c = min(open_y, close_y)
+                            height = max(3, abs(close_y - open_y))
+                            render_surface.fill(color_candle, (x_center - body_half, top_y_c, body_width, height))
+                    finally:
+                        render_surface.unlock()
+
+                dirty.append(rect)
+                prev_zone_keys["chart"] = chart_key
+
+            prev_upper_state = upper_state
+
+        # --- Marquee zone: scrolling strip (not dimmed) ---
+        marquee_key = (int(marquee_x), marquee_rev)
+        if marquee_key != prev_zone_keys.get("marquee"):
+            rect = ZONE_RECTS["marquee"]
+            render_surface.blit(BG_SURFACE, rect, rect)
+
+            # Binary-search the first visible surface, collect up to the right edge,
+            # then blit them in one C-level call
+            blit_list = []
+            strip_x = int(marquee_x)
+            first = bisect_left(local_ends, -strip_x)
+            current_pos = strip_x + (local_ends[first - 1] if first else 0)
+            for surf, width in islice(local_surfaces, first, None):
+                if current_pos > render_width:
+                    break
+                blit_list.append((surf, (current_pos, MARQUEE_Y)))
                 current_pos += width
-                continue
-            if current_pos > render_width:
-                break
-            render_surface.blit(surf, (current_pos, MARQUEE_Y))
-            current_pos += width
-
-        # Output to screen (with scaling if needed)
-        screen.fill(BLACK)
-        if scale_factor != 1.0:
-            scaled = pygame.transform.smoothscale(render_surface, (display_width, display_height))
-            screen.blit(scaled, (offset_x, offset_y))
+            render_surface.blits(blit_list, doreturn=False)
+
+            dirty.append(rect)
+            prev_zone_keys["marquee"] = marquee_key
+
+        # Present only the zones redrawn this frame
+        if dirty:
+            if scale_factor != 1.0:
+                # Software-scaled fallback: point-sampled rescale of the whole frame
+                screen.fill(BLACK)
+                scaled = pygame.transform.scale(render_surface, (display_width, display_height))
+                screen.blit(scaled, (offset_x, offset_y))
+                pygame.display.flip()
+            else:
+                for rect in dirty:
+                    screen.blit(render_surface, rect, rect)
+                pygame.display.update(dirty)
+
+        idle = time.monotonic() - last_change >= IDLE_AFTER
+        interval = idle_interval if idle else frame_interval
+        next_frame += interval
+        delay = next_frame - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
         else:
-            screen.blit(render_surface, (0, 0))
-
-        pygame.display.flip()
-        clock.tick(FPS)
+            # Running behind: resync instead of rendering a burst of catch-up frames
+            next_frame = time.monotonic()
         pygame.event.pump()
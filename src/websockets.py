@@ -1,31 +1,51 @@
 """
 WebSocket clients (Binance, Kraken) + polling fallback (CoinGecko) for real-time prices.
 Handles initial REST bootstrap + live updates with thread-safe data writes.
+Live feeds share one asyncio event loop (run_ws_manager) in a single background thread.
 Automatic reconnection with exponential backoff.
 """
 import json
-import time
 import random
+import asyncio
 import logging
 import requests
-import websocket
+import websockets
 
-from src.constants import MAIN_SYMBOLS, MARQUEE_SYMBOLS, KRAKEN_PAIRS, COINGECKO_IDS
-from src.data import data, data_lock, binance_ws_status, kraken_ws_status
-from src.helpers import update_ticker_data
+try:
+    # Optional: several times faster than the stdlib parser on the tick hot path
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from src.constants import MAIN_SYMBOLS, KRAKEN_PAIRS, COINGECKO_IDS, SYMBOL_SOURCE
+import src.data as shared
+from src.data import Candle, data, data_lock, stop_event
+from src.helpers import create_http_session, update_ticker_data
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive REST session shared by bootstrap and CoinGecko polling
+# (sized for the concurrent bootstrap workers in app.py)
+_session = create_http_session(pool_size=8)
+
+# Binance stream symbol (uppercase, as sent in "s") → data key
+_BINANCE_KEYS = {k.upper(): k for k, src in SYMBOL_SOURCE.items() if src == "binance"}
+# Kraken pair without slash ("XMRUSDT") → data key
+_KRAKEN_CLEAN_TO_KEY = {v.replace("/", ""): k for k, v in KRAKEN_PAIRS.items()}
+# CoinGecko coin id → data key
+_COINGECKO_ID_TO_KEY = {v: k for k, v in COINGECKO_IDS.items()}
+
 # Initial data bootstrap (REST)
 def fetch_initial_binance(symbol: str):
     # Fetch 24hr ticker + recent 1m klines (for main symbols) from Binance.
     key = symbol.lower()
-    if data[key].source != "binance":
+    if SYMBOL_SOURCE.get(key) != "binance":
         return
 
     try:
         # 24hr ticker
-        resp_t = requests.get(
+        resp_t = _session.get(
             "https://api.binance.com/api/v3/ticker/24hr",
             params={"symbol": symbol.upper()},
             timeout=10
@@ -38,7 +58,7 @@ def fetch_initial_binance(symbol: str):
 
         # 1m klines bootstrap (only for main symbols)
         if symbol in MAIN_SYMBOLS:
-            resp_k = requests.get(
+            resp_k = _session.get(
                 "https://api.binance.com/api/v3/klines",
                 params={"symbol": symbol.upper(), "interval": "1m", "limit": 60},
                 timeout=10
@@ -51,21 +71,18 @@ def fetch_initial_binance(symbol: str):
                 ticker.candles.clear()
                 for kline in klines[:-1]:
                     o_time, o, h, l, c, *_ = kline
-                    ticker.candles.append({
-                        "start": o_time / 1000.0,
-                        "open": float(o),
-                        "high": float(h),
-                        "low": float(l),
-                        "close": float(c)
-                    })
+                    ticker.candles.append(Candle(
+                        o_time / 1000.0, float(o), float(h), float(l), float(c)
+                    ))
+                ticker.rebuild_candle_columns()
                 last_k = klines[-1]
-                ticker.current_candle = {
-                    "start": last_k[0] / 1000.0,
-                    "open": float(last_k[1]),
-                    "high": float(last_k[2]),
-                    "low": float(last_k[3]),
-                    "close": float(last_k[4])
-                }
+                ticker.current_candle = [
+                    last_k[0] / 1000.0,
+                    float(last_k[1]),
+                    float(last_k[2]),
+                    float(last_k[3]),
+                    float(last_k[4])
+                ]
 
         logger.info(f"Initial Binance data loaded for {symbol}")
 
@@ -76,7 +93,7 @@ def fetch_initial_kraken():
     # Fetch current ticker for all Kraken pairs via REST.
     try:
         pairs = ",".join(p.replace("/", "") for p in KRAKEN_PAIRS.values())
-        resp = requests.get(
+        resp = _session.get(
             "https://api.kraken.com/0/public/Ticker",
             params={"pair": pairs},
             timeout=10
@@ -85,8 +102,10 @@ def fetch_initial_kraken():
         result = resp.json()["result"]
 
         for api_pair, ticker_data in result.items():
-            pair_clean = next((v.replace("/", "") for v in KRAKEN_PAIRS.values() if v.replace("/", "") in api_pair), None)
-            key = next((k for k, v in KRAKEN_PAIRS.items() if v.replace("/", "") == pair_clean), None)
+            # REST may return Kraken's own pair names (e.g. "XXMRZUSD") → substring fallback
+            key = _KRAKEN_CLEAN_TO_KEY.get(api_pair)
+            if key is None:
+                key = next((k for clean, k in _KRAKEN_CLEAN_TO_KEY.items() if clean in api_pair), None)
             if not key or "c" not in ticker_data:
                 continue
 
@@ -107,18 +126,17 @@ def fetch_initial_coingecko():
         "vs_currencies": "usd",
         "include_24hr_change": "true"
     }
-    headers = {"User-Agent": "rpi-crypto-ticker-display/1.0"}
 
     try:
-        resp = requests.get(url, params=params, headers=headers, timeout=10)
+        resp = _session.get(url, params=params, timeout=10)
         resp.raise_for_status()
         result = resp.json()
 
         for coin_id, ticker_data in result.items():
             price = ticker_data.get("usd")
             change = ticker_data.get("usd_24h_change", 0.0)
-            if price is not None:
-                key = next(k for k, v in COINGECKO_IDS.items() if v == coin_id)
+            key = _COINGECKO_ID_TO_KEY.get(coin_id)
+            if price is not None and key is not None:
                 update_ticker_data(key, price, change, update_marquee=True)
 
         logger.info("Initial CoinGecko data loaded")
@@ -127,18 +145,17 @@ def fetch_initial_coingecko():
         logger.error(f"Initial CoinGecko fetch failed: {e}")
 
 # Kraken WebSocket handlers
-def kraken_on_message(ws, message):
+def kraken_on_message(message):
     # Parse ticker updates from Kraken WS.
     try:
-        msg = json.loads(message)
+        msg = _json_loads(message)
         if isinstance(msg, dict) and "event" in msg:
             return
         if not isinstance(msg, list) or len(msg) < 4 or msg[2] != "ticker":
             return
 
         _, ticker_data, _, pair = msg
-        pair_clean = pair.replace("/", "")
-        key = next((k for k, v in KRAKEN_PAIRS.items() if v.replace("/", "") == pair_clean), None)
+        key = _KRAKEN_CLEAN_TO_KEY.get(pair.replace("/", ""))
 
         if not key or "c" not in ticker_data or "o" not in ticker_data:
             return
@@ -151,58 +168,54 @@ def kraken_on_message(ws, message):
     except Exception as e:
         logger.error("Kraken message parse error", exc_info=True)
 
-def kraken_on_error(ws, error):
-    global kraken_ws_status
-    kraken_ws_status = "Error"
+def kraken_on_error(error):
+    shared.kraken_ws_status = "error"
     err_str = str(error).lower()
     if "restarting, please reconnect" in err_str:
         logger.info("Kraken WS: server requested reconnect (maintenance/restart)")
     else:
         logger.error(f"Kraken WS error: {error}", exc_info=True)
 
-def kraken_on_close(ws, code=None, reason=None):
-    global kraken_ws_status
-    kraken_ws_status = "Reconnecting…"
-    reason_str = str(reason) if reason is not None else "no reason"
+def kraken_on_close(code=None, reason=None):
+    shared.kraken_ws_status = "reconnecting…"
+    reason_str = str(reason) if reason else "no reason"
     if "restarting, please reconnect" in reason_str.lower():
         logger.info("Kraken WS closed cleanly (server restart/maintenance)")
     else:
         logger.warning(f"Kraken WS closed - code={code}, reason={reason_str}")
 
-def kraken_on_open(ws):
-    global kraken_ws_status
-    kraken_ws_status = "Live"
-    subscribe_msg = {
+async def run_kraken_websocket():
+    # Kraken WS client with exponential backoff reconnection.
+    subscribe_msg = json.dumps({
         "event": "subscribe",
         "pair": list(KRAKEN_PAIRS.values()),
         "subscription": {"name": "ticker"}
-    }
-    ws.send(json.dumps(subscribe_msg))
-    logger.info("Kraken subscription sent")
-
-def run_kraken_websocket():
-    # Kraken WS client with exponential backoff reconnection.
+    })
     backoff = 1.0
-    while True:
-        ws = websocket.WebSocketApp(
-            "wss://ws.kraken.com",
-            on_message=kraken_on_message,
-            on_error=kraken_on_error,
-            on_close=kraken_on_close,
-            on_open=kraken_on_open
-        )
-        ws.run_forever(ping_interval=25, ping_timeout=10)
+    while not stop_event.is_set():
+        try:
+            async with websockets.connect(
+                "wss://ws.kraken.com", ping_interval=25, ping_timeout=10
+            ) as ws:
+                shared.kraken_ws_status = "live"
+                await ws.send(subscribe_msg)
+                logger.info("Kraken subscription sent")
+                async for message in ws:
+                    kraken_on_message(message)
+            kraken_on_close(ws.close_code, ws.close_reason)
+        except Exception as e:
+            kraken_on_error(e)
         logger.info(f"Kraken WS disconnected → backoff {backoff:.1f}s")
-        time.sleep(backoff)
+        await asyncio.sleep(backoff)
         backoff = min(backoff * 1.8, 120)
 
 # Binance WebSocket handlers
-def binance_on_message(ws, message):
+def binance_on_message(message):
     # Parse ticker updates from Binance WS.
     try:
-        data_json = json.loads(message)
-        symbol = data_json.get("s", "").lower()
-        if symbol not in data or data[symbol].source != "binance":
+        data_json = _json_loads(message)
+        symbol = _BINANCE_KEYS.get(data_json.get("s"))
+        if symbol is None:
             return
         price = float(data_json["c"])
         change_pct = float(data_json["P"])
@@ -210,86 +223,77 @@ def binance_on_message(ws, message):
     except Exception as e:
         logger.error("Binance message parse error", exc_info=True)
 
-def binance_on_error(ws, error):
-    global binance_ws_status
-    binance_ws_status = "Error"
+def binance_on_error(error):
+    shared.binance_ws_status = "error"
     err_str = str(error).lower()
     if any(word in err_str for word in ["reconnect", "maintenance", "restart"]):
         logger.info("Binance WS: server requested reconnect/maintenance")
     else:
         logger.error(f"Binance WS error: {error}", exc_info=True)
 
-def binance_on_close(ws, code=None, reason=None):
-    global binance_ws_status
-    binance_ws_status = "Reconnecting…"
-    reason_str = str(reason) if reason is not None else "no reason"
+def binance_on_close(code=None, reason=None):
+    shared.binance_ws_status = "reconnecting…"
+    reason_str = str(reason) if reason else "no reason"
     if any(word in reason_str.lower() for word in ["reconnect", "maintenance", "restart"]):
         logger.info("Binance WS closed cleanly (server maintenance)")
     else:
         logger.warning(f"Binance WS closed - code={code}, reason={reason_str}")
 
-def binance_on_open(ws):
-    global binance_ws_status
-    binance_ws_status = "Live"
-    logger.info("Binance WS connected")
+async def run_binance_websocket():
+    # Binance WS client – subscribes to all configured Binance symbols in one stream.
+    binance_symbols = list(_BINANCE_KEYS.values())
+    if not binance_symbols:
+        logger.info("No Binance symbols configured - Binance WS not started")
+        return
+
+    streams = "/".join(f"{s}@ticker" for s in binance_symbols)
+    url = f"wss://stream.binance.com:9443/ws/{streams}"
 
-def run_binance_websocket():
-    # Binance WS client – subscribes dynamically to configured symbols.
     backoff = 1.0
-    while True:
-        binance_symbols = [
-            s.lower() for s in (MAIN_SYMBOLS + MARQUEE_SYMBOLS)
-            if data.get(s.lower(), {}).source == "binance"
-        ]
-        if not binance_symbols:
-            time.sleep(10)
-            continue
-
-        streams = "/".join(f"{s}@ticker" for s in binance_symbols)
-        url = f"wss://stream.binance.com:9443/ws/{streams}"
-
-        ws = websocket.WebSocketApp(
-            url,
-            on_message=binance_on_message,
-            on_error=binance_on_error,
-            on_close=binance_on_close,
-            on_open=binance_on_open
-        )
-        ws.run_forever(ping_interval=30, ping_timeout=10)
+    while not stop_event.is_set():
+        try:
+            async with websockets.connect(url, ping_interval=30, ping_timeout=10) as ws:
+                shared.binance_ws_status = "live"
+                logger.info("Binance WS connected")
+                async for message in ws:
+                    binance_on_message(message)
+            binance_on_close(ws.close_code, ws.close_reason)
+        except Exception as e:
+            binance_on_error(e)
         logger.info(f"Binance WS disconnected → backoff {backoff:.1f}s")
-        time.sleep(backoff)
+        await asyncio.sleep(backoff)
         backoff = min(backoff * 1.8, 120)
 
 # CoinGecko polling fallback
-def run_coingecko_polling():
+async def run_coingecko_polling():
     # Periodic polling for CoinGecko coins (rate-limit aware with backoff).
+    # The blocking HTTP call runs in the default executor so WS reads keep flowing.
     url = "https://api.coingecko.com/api/v3/simple/price"
     params = {
         "ids": ",".join(COINGECKO_IDS.values()),
         "vs_currencies": "usd",
         "include_24hr_change": "true"
     }
-    headers = {"User-Agent": "rpi-crypto-ticker-display/1.0"}
     backoff = 1.0
 
-    while True:
-        time.sleep(backoff)
+    while not stop_event.is_set():
+        await asyncio.sleep(backoff)
         try:
-            resp = requests.get(url, params=params, headers=headers, timeout=10)
+            resp = await asyncio.to_thread(_session.get, url, params=params, timeout=10)
             resp.raise_for_status()
             result = resp.json()
 
             for coin_id, ticker_data in result.items():
                 price = ticker_data.get("usd")
                 change = ticker_data.get("usd_24h_change", 0.0)
-                if price is not None:
-                    key = next(k for k, v in COINGECKO_IDS.items() if v == coin_id)
+                key = _COINGECKO_ID_TO_KEY.get(coin_id)
+                if price is not None and key is not None:
                     update_ticker_data(key, price, change)
 
             backoff = 300  # Normal interval: 5 min
 
         except requests.HTTPError as e:
-            if e.response and e.response.status_code == 429:
+            if e.response is not None and e.response.status_code == 429:
                 jitter = random.uniform(0, 30)
                 logger.warning(f"CoinGecko rate limit → backoff ~{180 + jitter:.0f}s")
                 backoff = 180 + jitter
@@ -299,3 +303,15 @@ def run_coingecko_polling():
         except Exception as e:
             logger.error(f"CoinGecko error: {e}")
             backoff = 60
+
+async def _ws_manager():
+    await asyncio.gather(
+        run_binance_websocket(),
+        run_kraken_websocket(),
+        run_coingecko_polling(),
+    )
+
+def run_ws_manager():
+    # Thread entry point: Binance + Kraken WS and CoinGecko polling multiplexed
+    # on one event loop (one OS thread instead of three).
+    asyncio.run(_ws_manager())